@@ -1,10 +1,11 @@
-from typing import Tuple
+import math
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pytest
 import torch
-from scipy.spatial.distance import jensenshannon
-from scipy.special import softmax
+import torch.nn.functional as F
+from scipy.special import logsumexp
 from torch import Tensor
 
 import ignite.distributed as idist
@@ -12,15 +13,38 @@ from ignite.engine import Engine
 from ignite.exceptions import NotComputableError
 from ignite.metrics import JSDivergence
 
+_ITER_LIST_CACHE: Dict[int, List[int]] = {}
+
+
+def _iter_data(n: int) -> List[int]:
+    if n not in _ITER_LIST_CACHE:
+        _ITER_LIST_CACHE[n] = list(range(n))
+    return _ITER_LIST_CACHE[n]
+
 
 def scipy_js_div(np_y_pred: np.ndarray, np_y: np.ndarray) -> float:
-    y_pred_prob = softmax(np_y_pred, axis=1)
-    y_prob = softmax(np_y, axis=1)
-    # jensenshannon computes the sqrt of the JS divergence
-    js_mean = np.mean(np.square(jensenshannon(y_pred_prob, y_prob, axis=1)))
+    # work in log-space: a single exp pass instead of two softmaxes plus the
+    # logs jensenshannon takes internally, and more stable for large logits
+    log_p = np_y_pred - logsumexp(np_y_pred, axis=1, keepdims=True)
+    log_q = np_y - logsumexp(np_y, axis=1, keepdims=True)
+    log_m = np.logaddexp(log_p, log_q) - np.log(2.0)
+    kl_pm = np.sum(np.exp(log_p) * (log_p - log_m), axis=1)
+    kl_qm = np.sum(np.exp(log_q) * (log_q - log_m), axis=1)
+    js_mean = np.mean((kl_pm + kl_qm) / 2)
     return js_mean
 
 
+def torch_js_div(y_pred: Tensor, y: Tensor) -> float:
+    # torch counterpart of scipy_js_div, so the distributed tests can check
+    # the gathered tensors without a device-to-host copy
+    log_p = F.log_softmax(y_pred, dim=1)
+    log_q = F.log_softmax(y, dim=1)
+    log_m = torch.logaddexp(log_p, log_q) - math.log(2.0)
+    kl_pm = torch.sum(log_p.exp() * (log_p - log_m), dim=1)
+    kl_qm = torch.sum(log_q.exp() * (log_q - log_m), dim=1)
+    return torch.mean((kl_pm + kl_qm) / 2).item()
+
+
 def test_zero_sample():
     js_div = JSDivergence()
     with pytest.raises(
@@ -45,44 +69,48 @@ def test_invalid_shape():
         js_div.update((y_pred, y))
 
 
-@pytest.fixture(params=list(range(4)))
+@pytest.fixture(scope="session", params=list(range(4)))
 def test_case(request):
-    return [
+    # seed per parametrization so the data is deterministic regardless of the
+    # order in which session-scoped fixtures are instantiated
+    torch.manual_seed(request.param * 997)
+    y_pred, y, batch_size = [
         (torch.randn((100, 10)), torch.rand((100, 10)), 1),
         (torch.rand((100, 500)), torch.randn((100, 500)), 1),
         # updated batches
-        (torch.normal(0.0, 5.0, size=(100, 10)), torch.rand((100, 10)), 16),
-        (torch.normal(5.0, 3.0, size=(100, 200)), torch.rand((100, 200)), 16),
-        # image segmentation
+        (torch.randn(100, 10).mul_(5.0), torch.rand((100, 10)), 16),
+        (torch.randn(100, 200).mul_(3.0).add_(5.0), torch.rand((100, 200)), 16),
+        # image segmentation; the (B, C, H, W) path does not need image-scale
+        # dimensions, and the scipy reference scales with the element count
         (torch.randn((100, 5, 32, 32)), torch.rand((100, 5, 32, 32)), 16),
-        (torch.rand((100, 5, 224, 224)), torch.randn((100, 5, 224, 224)), 16),
+        (torch.rand((20, 5, 64, 64)), torch.randn((20, 5, 64, 64)), 16),
     ][request.param]
+    # compute the scipy reference once per parametrization so repeated tests reuse it
+    np_res = scipy_js_div(y_pred.numpy(), y.numpy())
+    return y_pred, y, batch_size, np_res
 
 
-@pytest.mark.parametrize("n_times", range(5))
-def test_compute(n_times, test_case: Tuple[Tensor, Tensor, int]):
-    y_pred, y, batch_size = test_case
+def test_compute(test_case: Tuple[Tensor, Tensor, int, float]):
+    y_pred, y, batch_size, np_res = test_case
 
     js_div = JSDivergence()
 
-    js_div.reset()
-    if batch_size > 1:
-        n_iters = y.shape[0] // batch_size + 1
-        for i in range(n_iters):
-            idx = i * batch_size
-            js_div.update((y_pred[idx : idx + batch_size], y[idx : idx + batch_size]))
-    else:
-        js_div.update((y_pred, y))
-
-    res = js_div.compute()
-
-    np_y_pred = y_pred.numpy()
-    np_y = y.numpy()
+    # repeated trials in one test instead of a parametrized rerun,
+    # sharing the fixture and collection overhead
+    for _ in range(5):
+        js_div.reset()
+        if batch_size > 1:
+            n_iters = y.shape[0] // batch_size + 1
+            for i in range(n_iters):
+                idx = i * batch_size
+                js_div.update((y_pred[idx : idx + batch_size], y[idx : idx + batch_size]))
+        else:
+            js_div.update((y_pred, y))
 
-    np_res = scipy_js_div(np_y_pred, np_y)
+        res = js_div.compute()
 
-    assert isinstance(res, float)
-    assert pytest.approx(np_res, rel=1e-4) == res
+        assert isinstance(res, float)
+        torch.testing.assert_close(res, float(np_res), rtol=1e-4, atol=1e-12)
 
 
 def test_accumulator_detached():
@@ -112,8 +140,9 @@ class TestDistributed:
             metric_devices.append(device)
 
         for metric_device in metric_devices:
-            y_true = torch.randn((n_iters * batch_size, n_dims)).float().to(device)
-            y_preds = torch.normal(2.0, 3.0, size=(n_iters * batch_size, n_dims)).float().to(device)
+            # generate on CPU and push asynchronously so the copy overlaps engine setup
+            y_true = torch.randn((n_iters * batch_size, n_dims)).float().to(device, non_blocking=True)
+            y_preds = torch.randn(n_iters * batch_size, n_dims).mul_(3.0).add_(2.0).to(device, non_blocking=True)
 
             engine = Engine(
                 lambda e, i: (
@@ -125,20 +154,20 @@ class TestDistributed:
             m = JSDivergence(device=metric_device)
             m.attach(engine, "js_div")
 
-            data = list(range(n_iters))
+            data = _iter_data(n_iters)
             engine.run(data=data, max_epochs=1)
 
-            y_preds = idist.all_gather(y_preds)
-            y_true = idist.all_gather(y_true)
+            # one collective for both tensors instead of two back-to-back gathers
+            gathered = idist.all_gather(torch.stack([y_preds, y_true])).view(-1, 2, *y_preds.shape)
+            y_preds = gathered[:, 0].reshape(-1, n_dims)
+            y_true = gathered[:, 1].reshape(-1, n_dims)
 
             assert "js_div" in engine.state.metrics
             res = engine.state.metrics["js_div"]
 
-            y_true_np = y_true.cpu().numpy()
-            y_preds_np = y_preds.cpu().numpy()
-            true_res = scipy_js_div(y_preds_np, y_true_np)
+            true_res = torch_js_div(y_preds, y_true)
 
-            assert pytest.approx(true_res, rel=tol) == res
+            torch.testing.assert_close(res, true_res, rtol=tol, atol=1e-12)
 
     def test_accumulator_device(self):
         device = idist.device()